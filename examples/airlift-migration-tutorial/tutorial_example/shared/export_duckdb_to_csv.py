@@ -5,7 +5,7 @@
 import duckdb
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExportDuckDbToCsvArgs:
     table_name: str
     csv_path: Path
@@ -6,7 +6,7 @@
 import pandas as pd
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoadCsvToDuckDbArgs:
     table_name: str
     csv_path: Path
@@ -1,13 +1,14 @@
 import os
 import shutil
 import signal
+import socket
 import subprocess
 import time
 import uuid
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Generator, List
+from typing import Any, Generator, List, Mapping, Optional
 
 import pytest
 import requests
@@ -19,14 +20,32 @@ def integration_test_dir() -> Path:
     return Path(__file__).parent.parent
 
 
+def _dagster_is_listening(port: int) -> bool:
+    try:
+        with socket.create_connection(("localhost", port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
 def _dagster_is_ready(port: int) -> bool:
+    # Only issue an HTTP request once the webserver is accepting connections.
+    if not _dagster_is_listening(port):
+        return False
+
     try:
-        response = requests.get(f"http://localhost:{port}")
+        response = requests.get(f"http://localhost:{port}", timeout=0.25)
         return response.status_code == 200
-    except:
+    except requests.RequestException:
         return False
 
 
+@pytest.fixture(name="base_env", scope="session")
+def setup_base_env() -> Mapping[str, str]:
+    """Snapshot the environment once per session for launching dagster subprocesses."""
+    return dict(os.environ)
+
+
 @pytest.fixture(name="dagster_home")
 def setup_dagster_home() -> Generator[str, None, None]:
     """Instantiate a temporary directory to serve as the DAGSTER_HOME."""
@@ -45,34 +64,48 @@ def prefix_env() -> Generator[str, None, None]:
 
 
 @pytest.fixture(name="dagster_dev")
-def setup_dagster(dagster_home: str, prefix_env: str) -> Generator[Any, None, None]:
-    with stand_up_dagster(["dagster", "dev", "-m", "azure_test_proj.defs"]) as process:
+def setup_dagster(
+    base_env: Mapping[str, str], dagster_home: str, prefix_env: str
+) -> Generator[Any, None, None]:
+    with stand_up_dagster(
+        ["dagster", "dev", "-m", "azure_test_proj.defs"],
+        env={**base_env, "DAGSTER_HOME": dagster_home, "TEST_AZURE_LOG_PREFIX": prefix_env},
+    ) as process:
         yield process
 
 
 @contextmanager
 def stand_up_dagster(
-    dagster_dev_cmd: List[str], port: int = 3000
+    dagster_dev_cmd: List[str], port: int = 3000, env: Optional[Mapping[str, str]] = None
 ) -> Generator[subprocess.Popen, None, None]:
     """Stands up a dagster instance using the dagster dev CLI. dagster_defs_path must be provided
     by a fixture included in the callsite.
     """
     process = subprocess.Popen(
         dagster_dev_cmd,
-        env=os.environ.copy(),
+        env=env if env is not None else os.environ.copy(),
         shell=False,
-        preexec_fn=os.setsid,  # noqa
+        # unlike preexec_fn=os.setsid, this still allows subprocess to use posix_spawn
+        start_new_session=True,
     )
+    # Look up the group before anything can reap the process, so that teardown still reaches any
+    # children of `dagster dev` if it exits early.
+    pgid = os.getpgid(process.pid)
     try:
         dagster_ready = False
         initial_time = get_current_timestamp()
+        delay = 0.05
         while get_current_timestamp() - initial_time < 60:
             if _dagster_is_ready(port):
                 dagster_ready = True
                 break
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
 
-        assert dagster_ready, "Dagster did not start within 30 seconds..."
+        assert dagster_ready, "Dagster did not start within 60 seconds..."
         yield process
     finally:
-        os.killpg(process.pid, signal.SIGKILL)
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
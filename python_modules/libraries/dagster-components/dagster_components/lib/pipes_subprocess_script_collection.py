@@ -85,16 +85,24 @@ def load(cls, context: ComponentLoadContext) -> "PipesSubprocessScriptCollection
     def build_defs(self, load_context: "ComponentLoadContext") -> "Definitions":
         from dagster._core.definitions.definitions_class import Definitions
 
+        # resolve the interpreter once rather than searching PATH on every run
+        python_executable = shutil.which("python")
         return Definitions(
-            assets=[self._create_asset_def(path, specs) for path, specs in self.path_specs.items()],
+            assets=[
+                self._create_asset_def(path, specs, python_executable)
+                for path, specs in self.path_specs.items()
+            ],
             resources={"pipes_client": PipesSubprocessClient()},
         )
 
-    def _create_asset_def(self, path: Path, specs: Sequence[AssetSpec]) -> AssetsDefinition:
+    def _create_asset_def(
+        self, path: Path, specs: Sequence[AssetSpec], python_executable: Optional[str]
+    ) -> AssetsDefinition:
+        cmd = [python_executable, str(path)]
+
         # TODO: allow name paraeterization
         @multi_asset(specs=specs, name=f"script_{path.stem}")
         def _asset(context: AssetExecutionContext, pipes_client: PipesSubprocessClient):
-            cmd = [shutil.which("python"), path]
             return pipes_client.run(command=cmd, context=context).get_results()
 
         return _asset
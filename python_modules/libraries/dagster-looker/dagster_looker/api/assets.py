@@ -1,7 +1,17 @@
-from typing import Sequence, Type, cast
+import json
+import time
+from typing import Dict, Generator, Mapping, Optional, Sequence, Type, cast
 
-from dagster import AssetExecutionContext, AssetsDefinition, Failure, multi_asset
+from dagster import (
+    AssetExecutionContext,
+    AssetKey,
+    AssetsDefinition,
+    Failure,
+    MaterializeResult,
+    multi_asset,
+)
 from dagster._annotations import experimental
+from looker_sdk.sdk.api40.methods import Looker40SDK
 
 from dagster_looker.api.dagster_looker_api_translator import (
     DagsterLookerApiTranslator,
@@ -12,15 +22,91 @@
 )
 from dagster_looker.api.resource import LookerResource
 
+PDT_BUILD_POLL_INITIAL_INTERVAL_SECONDS = 0.5
+PDT_BUILD_POLL_MAX_INTERVAL_SECONDS = 8.0
+DEFAULT_PDT_BUILD_POLL_TIMEOUT_SECONDS = 60 * 60
+
+_PDT_BUILD_SUCCESS_STATUS = "done"
+_PDT_BUILD_IN_PROGRESS_STATUSES = {"running", "pending", "queued"}
+
+
+def _get_pdt_build_status(resp_text: Optional[str]) -> Optional[str]:
+    if not resp_text:
+        return None
+
+    try:
+        return json.loads(resp_text).get("status")
+    except (ValueError, AttributeError):
+        return None
+
+
+def _poll_pdt_builds(
+    context: AssetExecutionContext,
+    sdk: Looker40SDK,
+    pending_builds: Dict[str, AssetKey],
+    request_start_pdt_builds_by_key: Mapping[AssetKey, RequestStartPdtBuild],
+    poll_timeout_seconds: float,
+) -> Generator[MaterializeResult, None, Mapping[str, Optional[str]]]:
+    """Polls the status of the given PDT builds, keyed by materialization id, until each of them
+    has finished. Yields a result for each asset whose PDT build reported success, and returns the
+    final status of every other build, including a missing or unrecognized one, by view name.
+    """
+    pending_builds = dict(pending_builds)
+    failed_view_statuses = {}
+    interval = PDT_BUILD_POLL_INITIAL_INTERVAL_SECONDS
+    start_time = time.monotonic()
+    while True:
+        for materialization_id, asset_key in list(pending_builds.items()):
+            request_start_pdt_build = request_start_pdt_builds_by_key[asset_key]
+            check_pdt = sdk.check_pdt_build(materialization_id=materialization_id)
+            status = _get_pdt_build_status(check_pdt.resp_text)
+            if status in _PDT_BUILD_IN_PROGRESS_STATUSES:
+                continue
+
+            del pending_builds[materialization_id]
+            context.log.info(
+                f"Finished pdt build for Looker view `{request_start_pdt_build.view_name}` "
+                f"in Looker model `{request_start_pdt_build.model_name}`. "
+                f"Materialization id: {check_pdt.materialization_id}, "
+                f"response text: {check_pdt.resp_text}"
+            )
+            if status == _PDT_BUILD_SUCCESS_STATUS:
+                yield MaterializeResult(asset_key=asset_key)
+            else:
+                failed_view_statuses[request_start_pdt_build.view_name] = status
+
+        if not pending_builds:
+            break
+
+        if time.monotonic() - start_time > poll_timeout_seconds:
+            pending_view_names = [
+                request_start_pdt_builds_by_key[asset_key].view_name
+                for asset_key in pending_builds.values()
+            ]
+            raise Failure(
+                f"Timed out after {poll_timeout_seconds} seconds waiting for pdt builds "
+                f"for Looker views {pending_view_names} to finish."
+            )
+
+        time.sleep(interval)
+        interval = min(interval * 2, PDT_BUILD_POLL_MAX_INTERVAL_SECONDS)
+
+    return failed_view_statuses
+
 
 @experimental
 def build_looker_pdt_assets_definitions(
     resource_key: str,
     request_start_pdt_builds: Sequence[RequestStartPdtBuild],
     dagster_looker_translator: Type[DagsterLookerApiTranslator] = DagsterLookerApiTranslator,
+    poll_timeout_seconds: float = DEFAULT_PDT_BUILD_POLL_TIMEOUT_SECONDS,
+    name: Optional[str] = None,
 ) -> Sequence[AssetsDefinition]:
     """Returns the AssetsDefinitions of the executable assets for the given the list of refreshable PDTs.
 
+    All of the PDTs are materialized by a single subsettable multi-asset, which starts the builds
+    for the selected PDTs up front and then polls them until they have finished.
+
     Args:
         resource_key (str): The resource key to use for the Looker resource.
         request_start_pdt_builds (Optional[Sequence[RequestStartPdtBuild]]): A list of requests to start PDT builds.
@@ -28,38 +114,58 @@ def build_looker_pdt_assets_definitions(
             for documentation on all available fields.
         dagster_looker_translator (Optional[DagsterLookerApiTranslator]): The translator to
             use to convert Looker structures into assets. Defaults to DagsterLookerApiTranslator.
+        poll_timeout_seconds (float): The maximum number of seconds to wait for the started PDT
+            builds to finish before failing. The builds keep running in Looker after a timeout.
+            Defaults to one hour.
+        name (Optional[str]): The name of the op that materializes the PDTs. Defaults to
+            "looker_pdts". Must be set to a unique value when building several sets of PDTs in
+            the same code location.
 
     Returns:
         AssetsDefinition: The AssetsDefinitions of the executable assets for the given the list of refreshable PDTs.
     """
+    if not request_start_pdt_builds:
+        return []
+
     translator = dagster_looker_translator(None)
-    result = []
-    for request_start_pdt_build in request_start_pdt_builds:
-
-        @multi_asset(
-            specs=[
-                translator.get_asset_spec(
-                    LookerStructureData(
-                        structure_type=LookerStructureType.VIEW,
-                        data=LookmlView(
-                            view_name=request_start_pdt_build.view_name,
-                            sql_table_name=None,
-                        ),
-                    )
-                )
-            ],
-            name=f"{request_start_pdt_build.model_name}_{request_start_pdt_build.view_name}",
-            required_resource_keys={resource_key},
+    specs = [
+        translator.get_asset_spec(
+            LookerStructureData(
+                structure_type=LookerStructureType.VIEW,
+                data=LookmlView(
+                    view_name=request_start_pdt_build.view_name,
+                    sql_table_name=None,
+                ),
+            )
         )
-        def pdts(context: AssetExecutionContext):
-            looker = cast(LookerResource, getattr(context.resources, resource_key))
+        for request_start_pdt_build in request_start_pdt_builds
+    ]
+    request_start_pdt_builds_by_key = {
+        spec.key: request_start_pdt_build
+        for spec, request_start_pdt_build in zip(specs, request_start_pdt_builds)
+    }
+
+    @multi_asset(
+        specs=specs,
+        name=name or "looker_pdts",
+        can_subset=True,
+        required_resource_keys={resource_key},
+    )
+    def pdts(context: AssetExecutionContext):
+        looker = cast(LookerResource, getattr(context.resources, resource_key))
+        sdk = looker.get_sdk()
+
+        pending_builds = {}
+        failed_start_view_names = []
+        for asset_key in context.selected_asset_keys:
+            request_start_pdt_build = request_start_pdt_builds_by_key[asset_key]
 
             context.log.info(
                 f"Starting pdt build for Looker view `{request_start_pdt_build.view_name}` "
                 f"in Looker model `{request_start_pdt_build.model_name}`."
             )
 
-            materialize_pdt = looker.get_sdk().start_pdt_build(
+            materialize_pdt = sdk.start_pdt_build(
                 model_name=request_start_pdt_build.model_name,
                 view_name=request_start_pdt_build.view_name,
                 force_rebuild=request_start_pdt_build.force_rebuild,
@@ -71,17 +177,31 @@ def pdts(context: AssetExecutionContext):
             )
 
             if not materialize_pdt.materialization_id:
-                raise Failure("No materialization id was returned from Looker API.")
+                context.log.error(
+                    f"No materialization id was returned from Looker API for Looker view "
+                    f"`{request_start_pdt_build.view_name}`."
+                )
+                failed_start_view_names.append(request_start_pdt_build.view_name)
+                continue
 
-            check_pdt = looker.get_sdk().check_pdt_build(
-                materialization_id=materialize_pdt.materialization_id
-            )
+            pending_builds[materialize_pdt.materialization_id] = asset_key
 
-            context.log.info(
-                f"Materialization id: {check_pdt.materialization_id}, "
-                f"response text: {check_pdt.resp_text}"
-            )
+        # Poll the builds that did start before reporting any that failed to start, so that they
+        # are still materialized.
+        failed_view_statuses = yield from _poll_pdt_builds(
+            context,
+            sdk,
+            pending_builds=pending_builds,
+            request_start_pdt_builds_by_key=request_start_pdt_builds_by_key,
+            poll_timeout_seconds=poll_timeout_seconds,
+        )
 
-        result.append(pdts)
+        if failed_start_view_names or failed_view_statuses:
+            raise Failure(
+                "Pdt builds did not succeed. "
+                f"Looker views for which no build was started: {failed_start_view_names}. "
+                "Looker views whose build did not succeed (view name to reported status): "
+                f"{failed_view_statuses}."
+            )
 
-    return result
+    return [pdts]
@@ -76,6 +76,22 @@
     materialization_id="100",
 )
 mock_check_pdt_build = MaterializePDT(
+    materialization_id="100",
+    resp_text=json.dumps({"status": "done"}),
+)
+mock_running_check_pdt_build = MaterializePDT(
     materialization_id="100",
     resp_text=json.dumps({"status": "running"}),
 )
+mock_failed_check_pdt_build = MaterializePDT(
+    materialization_id="100",
+    resp_text=json.dumps({"status": "error"}),
+)
+
+mock_other_start_pdt_build = MaterializePDT(
+    materialization_id="101",
+)
+mock_other_check_pdt_build = MaterializePDT(
+    materialization_id="101",
+    resp_text=json.dumps({"status": "done"}),
+)
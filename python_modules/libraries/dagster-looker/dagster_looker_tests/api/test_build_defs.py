@@ -1,3 +1,4 @@
+import json
 from typing import Iterator
 
 import pytest
@@ -12,17 +13,22 @@
     RequestStartPdtBuild,
 )
 from dagster_looker.api.resource import LookerResource, load_looker_asset_specs
+from looker_sdk.sdk.api40.models import MaterializePDT
 
 from dagster_looker_tests.api.mock_looker_data import (
     mock_check_pdt_build,
+    mock_failed_check_pdt_build,
     mock_folders,
     mock_looker_dashboard,
     mock_looker_dashboard_bases,
     mock_lookml_explore,
     mock_lookml_models,
     mock_lookml_other_explore,
+    mock_other_check_pdt_build,
     mock_other_looker_dashboard,
+    mock_other_start_pdt_build,
     mock_other_user,
+    mock_running_check_pdt_build,
     mock_start_pdt_build,
     mock_user,
 )
@@ -191,6 +197,250 @@ def test_build_defs_with_pdts(
     assert result.success
 
 
+@responses.activate
+def test_build_defs_with_multiple_pdts(
+    looker_resource: LookerResource, looker_instance_data_mocks: responses.RequestsMock
+) -> None:
+    resource_key = "looker"
+
+    pdts = build_looker_pdt_assets_definitions(
+        resource_key=resource_key,
+        request_start_pdt_builds=[
+            RequestStartPdtBuild(model_name="my_model", view_name="my_view"),
+            RequestStartPdtBuild(model_name="my_model", view_name="my_other_view"),
+        ],
+    )
+
+    sdk = looker_resource.get_sdk()
+
+    my_view_start_url = f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_view/start"
+    my_other_view_start_url = f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_other_view/start"
+    for start_url in [my_view_start_url, my_other_view_start_url]:
+        responses.add(
+            method=responses.GET,
+            url=start_url,
+            body=sdk.serialize(api_model=mock_start_pdt_build),  # type: ignore
+        )
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/{mock_start_pdt_build.materialization_id}/status",
+        body=sdk.serialize(api_model=mock_check_pdt_build),  # type: ignore
+    )
+
+    result = materialize(
+        pdts,
+        resources={resource_key: looker_resource},
+        selection=[AssetKey(["view", "my_other_view"])],
+    )
+
+    assert result.success
+    assert responses.assert_call_count(my_view_start_url, 0)
+    assert responses.assert_call_count(my_other_view_start_url, 1)
+
+
+@responses.activate
+def test_build_defs_with_multiple_pdts_in_one_run(
+    looker_resource: LookerResource, looker_instance_data_mocks: responses.RequestsMock
+) -> None:
+    resource_key = "looker"
+
+    pdts = build_looker_pdt_assets_definitions(
+        resource_key=resource_key,
+        request_start_pdt_builds=[
+            RequestStartPdtBuild(model_name="my_model", view_name="my_view"),
+            RequestStartPdtBuild(model_name="my_model", view_name="my_other_view"),
+        ],
+    )
+
+    assert len(pdts) == 1
+
+    sdk = looker_resource.get_sdk()
+
+    for view_name, start_pdt_build, check_pdt_build in [
+        ("my_view", mock_start_pdt_build, mock_check_pdt_build),
+        ("my_other_view", mock_other_start_pdt_build, mock_other_check_pdt_build),
+    ]:
+        responses.add(
+            method=responses.GET,
+            url=f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/{view_name}/start",
+            body=sdk.serialize(api_model=start_pdt_build),  # type: ignore
+        )
+        responses.add(
+            method=responses.GET,
+            url=f"{TEST_BASE_URL}/api/4.0/derived_table/{start_pdt_build.materialization_id}/status",
+            body=sdk.serialize(api_model=check_pdt_build),  # type: ignore
+        )
+
+    result = materialize(pdts, resources={resource_key: looker_resource})
+
+    assert result.success
+    assert {
+        materialization.asset_key for materialization in result.get_asset_materialization_events()
+    } == {AssetKey(["view", "my_view"]), AssetKey(["view", "my_other_view"])}
+
+
+@responses.activate
+def test_build_defs_with_pdt_that_fails_to_start(
+    looker_resource: LookerResource, looker_instance_data_mocks: responses.RequestsMock
+) -> None:
+    resource_key = "looker"
+
+    pdts = build_looker_pdt_assets_definitions(
+        resource_key=resource_key,
+        request_start_pdt_builds=[
+            RequestStartPdtBuild(model_name="my_model", view_name="my_view"),
+            RequestStartPdtBuild(model_name="my_model", view_name="my_other_view"),
+        ],
+    )
+
+    sdk = looker_resource.get_sdk()
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_view/start",
+        body=sdk.serialize(api_model=MaterializePDT()),  # type: ignore
+    )
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_other_view/start",
+        body=sdk.serialize(api_model=mock_other_start_pdt_build),  # type: ignore
+    )
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/{mock_other_start_pdt_build.materialization_id}/status",
+        body=sdk.serialize(api_model=mock_other_check_pdt_build),  # type: ignore
+    )
+
+    result = materialize(pdts, resources={resource_key: looker_resource}, raise_on_error=False)
+
+    assert not result.success
+    assert [
+        materialization.asset_key for materialization in result.get_asset_materialization_events()
+    ] == [AssetKey(["view", "my_other_view"])]
+
+
+@responses.activate
+def test_build_defs_with_pdts_polls_until_done(
+    looker_resource: LookerResource,
+    looker_instance_data_mocks: responses.RequestsMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("dagster_looker.api.assets.PDT_BUILD_POLL_INITIAL_INTERVAL_SECONDS", 0)
+    resource_key = "looker"
+
+    pdts = build_looker_pdt_assets_definitions(
+        resource_key=resource_key,
+        request_start_pdt_builds=[RequestStartPdtBuild(model_name="my_model", view_name="my_view")],
+    )
+
+    sdk = looker_resource.get_sdk()
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_view/start",
+        body=sdk.serialize(api_model=mock_start_pdt_build),  # type: ignore
+    )
+
+    check_pdt_build_url = (
+        f"{TEST_BASE_URL}/api/4.0/derived_table/{mock_start_pdt_build.materialization_id}/status"
+    )
+    responses.add(
+        method=responses.GET,
+        url=check_pdt_build_url,
+        body=sdk.serialize(api_model=mock_running_check_pdt_build),  # type: ignore
+    )
+    responses.add(
+        method=responses.GET,
+        url=check_pdt_build_url,
+        body=sdk.serialize(api_model=mock_check_pdt_build),  # type: ignore
+    )
+
+    result = materialize(pdts, resources={resource_key: looker_resource})
+
+    assert result.success
+    assert responses.assert_call_count(check_pdt_build_url, 2)
+
+
+@responses.activate
+def test_build_defs_with_pdts_times_out(
+    looker_resource: LookerResource,
+    looker_instance_data_mocks: responses.RequestsMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("dagster_looker.api.assets.PDT_BUILD_POLL_INITIAL_INTERVAL_SECONDS", 0)
+    resource_key = "looker"
+
+    pdts = build_looker_pdt_assets_definitions(
+        resource_key=resource_key,
+        request_start_pdt_builds=[RequestStartPdtBuild(model_name="my_model", view_name="my_view")],
+        poll_timeout_seconds=0,
+    )
+
+    sdk = looker_resource.get_sdk()
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_view/start",
+        body=sdk.serialize(api_model=mock_start_pdt_build),  # type: ignore
+    )
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/{mock_start_pdt_build.materialization_id}/status",
+        body=sdk.serialize(api_model=mock_running_check_pdt_build),  # type: ignore
+    )
+
+    result = materialize(pdts, resources={resource_key: looker_resource}, raise_on_error=False)
+
+    assert not result.success
+    assert not result.get_asset_materialization_events()
+
+
+@pytest.mark.parametrize(
+    "check_pdt_build",
+    [
+        mock_failed_check_pdt_build,
+        MaterializePDT(materialization_id="100", resp_text=json.dumps({"status": "killed"})),
+        MaterializePDT(materialization_id="100", resp_text=json.dumps({})),
+        MaterializePDT(materialization_id="100", resp_text="not json"),
+        MaterializePDT(materialization_id="100"),
+    ],
+    ids=["error", "unknown_status", "missing_status", "malformed_response", "empty_response"],
+)
+@responses.activate
+def test_build_defs_with_failed_pdt(
+    looker_resource: LookerResource,
+    looker_instance_data_mocks: responses.RequestsMock,
+    check_pdt_build: MaterializePDT,
+) -> None:
+    resource_key = "looker"
+
+    pdts = build_looker_pdt_assets_definitions(
+        resource_key=resource_key,
+        request_start_pdt_builds=[RequestStartPdtBuild(model_name="my_model", view_name="my_view")],
+    )
+
+    sdk = looker_resource.get_sdk()
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/my_model/my_view/start",
+        body=sdk.serialize(api_model=mock_start_pdt_build),  # type: ignore
+    )
+
+    responses.add(
+        method=responses.GET,
+        url=f"{TEST_BASE_URL}/api/4.0/derived_table/{mock_start_pdt_build.materialization_id}/status",
+        body=sdk.serialize(api_model=check_pdt_build),  # type: ignore
+    )
+
+    result = materialize(pdts, resources={resource_key: looker_resource}, raise_on_error=False)
+
+    assert not result.success
+    assert not result.get_asset_materialization_events()
+
+
 @responses.activate
 def test_custom_asset_specs(
     looker_resource: LookerResource, looker_instance_data_mocks: responses.RequestsMock